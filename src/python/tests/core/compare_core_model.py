@@ -19,41 +19,59 @@ Use this script to check the ORM (and fix it if needed).
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from ensembl.core.models import Base
 from ensembl.utils.database import DBConnection
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
-from sqlalchemy import select
-from sqlalchemy.exc import NoResultFound, MultipleResultsFound, OperationalError, ProgrammingError
-from sqlalchemy.orm import Session
+from sqlalchemy import select, Table
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
+# Default number of concurrent table probes, kept well below MySQL's default max_connections
+MAX_WORKERS = 8
 
-def check_tables(session: Session, only_table: str = "") -> None:
+
+def check_tables(dbc: DBConnection, only_table: str = "", max_workers: int = MAX_WORKERS) -> None:
     """Load data from a core using the ORM to check for any discrepancies in the definitions.
 
+    Each table is probed on its own connection from the engine's shared pool so the per-table
+    round-trips to the server can overlap. Keep `max_workers` within the engine's pool size.
+
     Args:
-        session: SQLAlchemy session.
+        dbc: Database connection to the core database to check.
         only_table: Only check this one table instead of all of the tables defined in the ORM.
+        max_workers: Number of tables to probe concurrently.
     """
-    success = []
-    errors = []
-    for table_name, table in Base.metadata.tables.items():
-        if isinstance(table_name, tuple):
-            table_name = table_name[0]
-        if only_table and table_name != only_table:
-            continue
+
+    def _probe(table_name: str, table: Table) -> tuple[str, Optional[Exception]]:
         logging.debug(f"Check table {table_name}")
-        stmt = select(table)
+        # Only probing the schema, so ask the server for at most one row
+        stmt = select(table).limit(1)
         try:
-            session.execute(stmt).one()
-            success.append(table_name)
-        except (NoResultFound, MultipleResultsFound):
-            success.append(table_name)
+            with dbc.connect() as connection:
+                connection.execute(stmt).first()
         except (OperationalError, ProgrammingError) as err:
-            # Show the problematic query and continue
-            logging.warning(f"{table_name}: {err}")
-            errors.append(table_name)
+            return table_name, err
+        return table_name, None
+
+    tables = {}
+    for table_name, table in Base.metadata.tables.items():
+        if only_table and table_name != only_table:
+            continue
+        tables[table_name] = table
+
+    success = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for table_name, err in executor.map(_probe, tables.keys(), tables.values()):
+            if err is None:
+                success.append(table_name)
+            else:
+                # Show the problematic query and continue
+                logging.warning(f"{table_name}: {err}")
+                errors.append(table_name)
 
     logging.info(f"{len(success)} tables successfully queried with the ORM")
     if errors:
@@ -70,9 +88,9 @@ def main() -> None:
     parser.add_log_arguments(add_log_file=True)
     args = parser.parse_args()
     init_logging_with_args(args)
-    dbc = DBConnection(args.url, reflect=False)
-    with dbc.session_scope() as session:
-        check_tables(session, only_table=args.table)
+    # Size the connection pool to the probe workers so no thread waits on a checkout
+    dbc = DBConnection(args.url, reflect=False, pool_size=MAX_WORKERS, max_overflow=0)
+    check_tables(dbc, only_table=args.table)
 
 
 if __name__ == "__main__":
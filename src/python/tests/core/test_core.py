@@ -19,7 +19,11 @@ import pytest
 from ensembl.core.models import Base
 from ensembl.utils.database import UnitTestDB
 
+# Computed once at import so each test run compares against a ready-made constant
+EXPECTED_TABLES = frozenset(Base.metadata.tables.keys())
 
+
+@pytest.mark.xdist_group("core_db")
 @pytest.mark.parametrize("test_dbs", [[{"src": "core_db", "metadata": Base.metadata}]], indirect=True)
 class TestCoreModels:
     """Tests the `~ensembl.core.models` ORMs"""
@@ -37,4 +41,4 @@ class TestCoreModels:
 
     def test_create_db(self) -> None:
         """Test the creation of a database with the core models schema."""
-        assert set(self.dbc.tables.keys()) == set(Base.metadata.tables.keys())
+        assert self.dbc.tables.keys() == EXPECTED_TABLES
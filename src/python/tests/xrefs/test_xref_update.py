@@ -18,7 +18,11 @@ import pytest
 from ensembl.utils.database import UnitTestDB
 from ensembl.xrefs.xref_update_db_model import Base
 
+# Computed once at import so each test run compares against a ready-made constant
+EXPECTED_TABLES = frozenset(Base.metadata.tables.keys())
 
+
+@pytest.mark.xdist_group("core_db")
 @pytest.mark.parametrize("test_dbs", [[{"src": "core_db"}]], indirect=True)
 class TestCoreModels:
     """Tests the `ensembl.xrefs.xref_update_db_model` ORMs"""
@@ -37,4 +41,4 @@ class TestCoreModels:
     def test_create_db(self) -> None:
         """Test the creation of a database with the xref_update models schema."""
         self.dbc.create_all_tables(Base.metadata)
-        assert set(self.dbc.tables.keys()) == set(Base.metadata.tables.keys())
+        assert self.dbc.tables.keys() == EXPECTED_TABLES